@@ -2,20 +2,19 @@ import sys
 import os
 import time
 import getpass
-import requests
-import json
-from datetime import datetime
+import hashlib
+import queue
+import threading
+import orjson
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QProgressBar, QLabel, QPushButton, QMessageBox, 
-    QSizePolicy, QFrame, QGraphicsDropShadowEffect, QSpacerItem,
+    QPlainTextEdit, QProgressBar, QLabel, QPushButton, QMessageBox, 
+    QFrame,
     QFileDialog, QLineEdit
 )
-from PyQt6.QtGui import QFont, QIcon, QCursor, QPixmap, QPainter, QColor, QPalette
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect
-
-# Módulo de automação SAP (operações de backend)
-import Sap
+from PyQt6.QtGui import QFont, QIcon, QCursor, QPixmap, QPixmapCache, QTextCursor, QPainter, QColor
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, QRectF, QUrl, pyqtSignal, pyqtSlot
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 USUARIO = getpass.getuser().upper()
 
@@ -44,67 +43,119 @@ COLORS = {
     'error': '#f87171'
 }
 
-# Diretório de logs da aplicação (contexto do usuário)
+# Máximo de linhas mantidas no console; o histórico completo fica no arquivo de log
+MAX_LOG_LINES = 5000
+
+# Diretório de logs da aplicação (contexto do usuário); criado sob demanda,
+# na primeira gravação, e não na importação
 LOGS_DIR = os.path.join(os.path.expanduser("~"), "SAP_Robo_Logs")
-if not os.path.exists(LOGS_DIR):
-    os.makedirs(LOGS_DIR)
+
+# Prefixo dos logs de execução do usuário atual
+_USER_LOG_PREFIX = os.path.join(LOGS_DIR, USUARIO + "_")
 
 # Caminho do arquivo de configuração persistente
 CONFIG_FILE = os.path.join(LOGS_DIR, "config.json")
 
 def load_config():
     """Carrega configurações salvas"""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    # Arquivo ausente cai no OSError: dispensa um stat prévio
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
 
 def save_config(config):
     """Salva configurações"""
     try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     except Exception as e:
         print(f"Erro ao salvar configuração: {e}")
 
-# --- Componentes de UI ---
-class CleanCard(QFrame):
-    def __init__(self, elevated=False):
-        super().__init__()
-        self.setFrameStyle(QFrame.Shape.NoFrame)
-        
-        bg_color = COLORS['surface_elevated'] if elevated else COLORS['surface']
-        self.setStyleSheet(f"""
+# Último segundo formatado como HH:MM:SS, em texto e em bytes
+# (reaproveitado dentro do mesmo segundo)
+_last_sec = [0, "", b""]
+
+def _tick():
+    s = int(time.time())
+    if s != _last_sec[0]:
+        lt = time.localtime(s)
+        hms = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        _last_sec[:] = [s, hms, hms.encode('ascii')]
+    return _last_sec
+
+def _hms():
+    """Retorna o horário atual em HH:MM:SS, formatando no máximo uma vez por segundo"""
+    return _tick()[1]
+
+def _hms_bytes():
+    """Mesmo que _hms, já codificado para gravação direta no arquivo de log"""
+    return _tick()[2]
+
+# Imagens remotas da interface e seu cache em disco
+URL_ICON = "https://i.ibb.co/m5LgjRfL/Robo.png"
+URL_LOGO = "https://i.ibb.co/Zp4D8B90/neodent-logo.png"
+IMG_CACHE_DIR = os.path.join(LOGS_DIR, "img_cache")
+
+def _cache_path(url):
+    nome = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(IMG_CACHE_DIR, f"{nome}.png")
+
+def _ler_cache(url):
+    """Retorna os bytes da imagem em cache, ou b"" se ainda não foi baixada"""
+    try:
+        with open(_cache_path(url), 'rb') as f:
+            return f.read()
+    except OSError:
+        return b""
+
+def _decodificar_imagem(url, dados):
+    """Decodifica a imagem e guarda o pixmap no QPixmapCache, para não decodificar de novo"""
+    pix = QPixmap()
+    if pix.loadFromData(dados):
+        QPixmapCache.insert(url, pix)
+    return pix
+
+def _gravar_cache(url, dados):
+    """Salva a imagem baixada no cache com escrita atômica (temporário + os.replace)"""
+    caminho = _cache_path(url)
+    try:
+        os.makedirs(IMG_CACHE_DIR, exist_ok=True)
+        tmp = f"{caminho}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(dados)
+        os.replace(tmp, caminho)
+    except OSError as e:
+        print(f"Erro ao salvar imagem em cache: {e}")
+
+# --- Folhas de estilo dos componentes (montadas uma única vez na importação) ---
+# Sombra do card elevado: espaço reservado (esquerda, topo, direita, base),
+# deslocamento vertical, largura do esmaecimento e opacidade total
+SHADOW_MARGINS = (12, 4, 12, 20)
+SHADOW_OFFSET_Y = 8
+SHADOW_BLUR = 12
+SHADOW_ALPHA = 30
+
+def _card_qss(bg_color, margin="0px"):
+    return f"""
             CleanCard {{
                 background-color: {bg_color};
                 border: 1px solid {COLORS['border']};
                 border-radius: 16px;
                 padding: 24px;
+                margin: {margin};
             }}
-        """)
-        
-        if elevated:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(25)
-            shadow.setColor(QColor(0, 0, 0, 30))
-            shadow.setOffset(0, 8)
-            self.setGraphicsEffect(shadow)
+        """
 
-class ModernButton(QPushButton):
-    def __init__(self, text, style='primary', icon_only=False):
-        super().__init__(text)
-        self.button_style = style
-        self.icon_only = icon_only
-        self.setMinimumHeight(48)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._setup_style()
-        
-    def _setup_style(self):
-        if self.button_style == 'primary':
-            self.setStyleSheet(f"""
+CARD_QSS = _card_qss(COLORS['surface'])
+_left, _top, _right, _bottom = SHADOW_MARGINS
+CARD_ELEVATED_QSS = _card_qss(
+    COLORS['surface_elevated'], f"{_top}px {_right}px {_bottom}px {_left}px"
+)
+
+PRIMARY_BTN_QSS = f"""
                 ModernButton {{
                     background-color: {COLORS['primary']};
                     color: {COLORS['text']};
@@ -125,9 +176,9 @@ class ModernButton(QPushButton):
                     background-color: rgba(255, 255, 255, 0.1);
                     color: {COLORS['text_muted']};
                 }}
-            """)
-        elif self.button_style == 'secondary':
-            self.setStyleSheet(f"""
+            """
+
+SECONDARY_BTN_QSS = f"""
                 ModernButton {{
                     background-color: transparent;
                     color: {COLORS['text']};
@@ -145,9 +196,9 @@ class ModernButton(QPushButton):
                     border-color: rgba(255, 255, 255, 0.05);
                     color: {COLORS['text_muted']};
                 }}
-            """)
-        elif self.button_style == 'ghost':
-            self.setStyleSheet(f"""
+            """
+
+GHOST_BTN_QSS = f"""
                 ModernButton {{
                     background-color: transparent;
                     color: {COLORS['text_secondary']};
@@ -161,7 +212,233 @@ class ModernButton(QPushButton):
                     background-color: rgba(255, 255, 255, 0.08);
                     color: {COLORS['text']};
                 }}
-            """)
+            """
+
+BUTTON_QSS = {
+    'primary': PRIMARY_BTN_QSS,
+    'secondary': SECONDARY_BTN_QSS,
+    'ghost': GHOST_BTN_QSS
+}
+
+_STATUS_DOT_COLORS = {
+    'idle': '#6b7280',
+    'running': COLORS['accent'],
+    'success': COLORS['success'],
+    'error': COLORS['error'],
+    'warning': COLORS['warning']
+}
+
+STATUS_DOT_QSS = {
+    status: f"""
+            StatusDot {{
+                background-color: {color};
+                border-radius: 6px;
+                border: 2px solid rgba(255, 255, 255, 0.2);
+            }}
+        """
+    for status, color in _STATUS_DOT_COLORS.items()
+}
+
+PROGRESS_BAR_QSS = f"""
+            CleanProgressBar {{
+                background-color: rgba(255, 255, 255, 0.1);
+                border-radius: 3px;
+                border: none;
+            }}
+            CleanProgressBar::chunk {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                    stop:0 {COLORS['primary']}, stop:1 {COLORS['accent']});
+                border-radius: 3px;
+            }}
+        """
+
+# Tema da janela e do diálogo de conclusão: marcadores {chave} de COLORS
+# resolvidos uma única vez na importação
+_THEME_TEMPLATE = """
+    * {{
+        font-family: 'Inter', 'SF Pro Display', 'Segoe UI', system-ui, sans-serif;
+    }}
+
+    QWidget {{
+        background-color: {background};
+        color: {text};
+    }}
+
+    QPlainTextEdit {{
+        background-color: rgba(0, 0, 0, 0.2);
+        color: {text};
+        font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace;
+        font-size: 13px;
+        border: none;
+        border-radius: 12px;
+        padding: 16px;
+        line-height: 1.6;
+        selection-background-color: {accent};
+    }}
+
+    QLineEdit {{
+        background-color: rgba(0, 0, 0, 0.2);
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 13px;
+    }}
+
+    QLineEdit:focus {{
+        border: 1px solid {accent};
+    }}
+
+    QLineEdit:disabled {{
+        background-color: rgba(0, 0, 0, 0.1);
+        color: {text_muted};
+    }}
+
+    QScrollBar:vertical {{
+        background-color: transparent;
+        width: 6px;
+        border-radius: 3px;
+    }}
+
+    QScrollBar::handle:vertical {{
+        background-color: rgba(255, 255, 255, 0.2);
+        border-radius: 3px;
+        min-height: 20px;
+    }}
+
+    QScrollBar::handle:vertical:hover {{
+        background-color: rgba(255, 255, 255, 0.3);
+    }}
+
+    QScrollBar:horizontal {{
+        background-color: transparent;
+        height: 6px;
+        border-radius: 3px;
+    }}
+
+    QScrollBar::handle:horizontal {{
+        background-color: rgba(255, 255, 255, 0.2);
+        border-radius: 3px;
+        min-width: 20px;
+    }}
+
+    QScrollBar::handle:horizontal:hover {{
+        background-color: rgba(255, 255, 255, 0.3);
+    }}
+"""
+
+_MSGBOX_TEMPLATE = """
+    QMessageBox {{
+        background-color: {surface};
+        color: {text};
+        font-family: 'Inter', sans-serif;
+        border-radius: 12px;
+    }}
+    QMessageBox QLabel {{
+        color: {text};
+        font-size: 14px;
+        padding: 8px;
+    }}
+    QMessageBox QPushButton {{
+        background-color: {primary};
+        color: {text};
+        border: none;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-weight: 600;
+        font-size: 14px;
+        min-width: 80px;
+    }}
+    QMessageBox QPushButton:hover {{
+        background-color: {primary_hover};
+    }}
+    QMessageBox QPushButton:pressed {{
+        background-color: {primary};
+    }}
+"""
+
+_GLOBAL_QSS = _THEME_TEMPLATE.format_map(COLORS)
+_MSGBOX_QSS = _MSGBOX_TEMPLATE.format_map(COLORS)
+
+# --- Componentes de UI ---
+class CleanCard(QFrame):
+    # Sombras já renderizadas, compartilhadas entre cards: (largura, altura, dpr) -> QPixmap
+    _shadow_cache = {}
+    _SHADOW_CACHE_MAX = 8
+
+    def __init__(self, elevated=False):
+        super().__init__()
+        self.setFrameStyle(QFrame.Shape.NoFrame)
+        self.setStyleSheet(CARD_ELEVATED_QSS if elevated else CARD_QSS)
+        
+        # A sombra é pré-renderizada em um pixmap (refeito só no resize), em vez de
+        # QGraphicsDropShadowEffect, que refaz o blur em software a cada repaint
+        self.elevated = elevated
+        self._shadow = None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.elevated:
+            self._shadow = self._cached_shadow(self.size(), self.devicePixelRatioF())
+
+    def paintEvent(self, event):
+        if self._shadow is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self._shadow)
+            painter.end()
+        super().paintEvent(event)
+
+    @classmethod
+    def _cached_shadow(cls, size, dpr):
+        key = (size.width(), size.height(), dpr)
+        pix = cls._shadow_cache.get(key)
+        if pix is None:
+            # Limite simples: descarta a entrada mais antiga (resize contínuo da janela)
+            if len(cls._shadow_cache) >= cls._SHADOW_CACHE_MAX:
+                del cls._shadow_cache[next(iter(cls._shadow_cache))]
+            pix = cls._shadow_cache[key] = cls._render_shadow(size, dpr)
+        return pix
+
+    @staticmethod
+    def _render_shadow(size, dpr):
+        pix = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+
+        left, top, right, bottom = SHADOW_MARGINS
+        card = QRectF(left, top, size.width() - left - right, size.height() - top - bottom)
+
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Camadas concêntricas translúcidas aproximam o blur: o centro acumula
+        # todas as camadas e a borda externa apenas uma
+        painter.setBrush(QColor(0, 0, 0, -(-SHADOW_ALPHA // SHADOW_BLUR)))
+        base = card.translated(0, SHADOW_OFFSET_Y)
+        for i in range(SHADOW_BLUR, 0, -1):
+            painter.drawRoundedRect(base.adjusted(-i, -i, i, i), 16 + i, 16 + i)
+
+        # Remove a sombra sob o próprio card; fica visível só a parte externa
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+        painter.setBrush(Qt.GlobalColor.black)
+        painter.drawRoundedRect(card, 16, 16)
+        painter.end()
+        return pix
+
+class ModernButton(QPushButton):
+    def __init__(self, text, style='primary', icon_only=False):
+        super().__init__(text)
+        self.button_style = style
+        self.icon_only = icon_only
+        self.setMinimumHeight(48)
+        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self._setup_style()
+        
+    def _setup_style(self):
+        qss = BUTTON_QSS.get(self.button_style)
+        if qss:
+            self.setStyleSheet(qss)
 
 class StatusDot(QLabel):
     def __init__(self):
@@ -171,104 +448,290 @@ class StatusDot(QLabel):
         self._update_style()
         
     def set_status(self, status):
+        # Mesmo status: evita o setStyleSheet e o repolish do widget
+        if status == self.status:
+            return
         self.status = status
         self._update_style()
         
     def _update_style(self):
-        colors = {
-            'idle': '#6b7280',
-            'running': COLORS['accent'],
-            'success': COLORS['success'],
-            'error': COLORS['error'],
-            'warning': COLORS['warning']
-        }
-        
-        color = colors.get(self.status, colors['idle'])
-        self.setStyleSheet(f"""
-            StatusDot {{
-                background-color: {color};
-                border-radius: 6px;
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            }}
-        """)
+        self.setStyleSheet(STATUS_DOT_QSS.get(self.status, STATUS_DOT_QSS['idle']))
 
 class CleanProgressBar(QProgressBar):
     def __init__(self):
         super().__init__()
         self.setTextVisible(False)
         self.setFixedHeight(6)
-        self.setStyleSheet(f"""
-            CleanProgressBar {{
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 3px;
-                border: none;
-            }}
-            CleanProgressBar::chunk {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 {COLORS['primary']}, stop:1 {COLORS['accent']});
-                border-radius: 3px;
-            }}
-        """)
+        self.setStyleSheet(PROGRESS_BAR_QSS)
+
+# --- Worker Integrado ---
+# Log em disco: buffer da thread de gravação e prazo máximo de uma linha sem flush
+LOG_BUFFER_BYTES = 65536
+LOG_FLUSH_INTERVAL = 1.0
+# Tamanho máximo de um log de execução; depois dele, só linhas urgentes (erros e final) são gravadas
+LOG_MAX_BYTES = 20_000_000
+B_LOG_LIMITE = (f"--- Log atingiu {LOG_MAX_BYTES // 1_000_000} MB: mensagens comuns seguintes "
+                "ficam apenas na tela e no CSV ---\n").encode('utf-8')
+# Logs de execução mais antigos que isso são removidos ao iniciar uma nova execução
+LOG_RETENTION_DAYS = 30
+# Intervalo mínimo entre atualizações de progresso enviadas à interface (~30 fps)
+PROGRESS_MIN_INTERVAL = 0.033
+
+# Trechos fixos do log em disco, codificados uma única vez
+B_EXEC_INICIADA = "=== Execução iniciada em ".encode('utf-8')
+B_ARQUIVO_SEL = "Arquivo selecionado: ".encode('utf-8')
+B_EXEC_OK = "✓ Execução concluída com sucesso".encode('utf-8')
+B_ERRO_CRITICO = "✗ Erro crítico: ".encode('utf-8')
+B_EXEC_CANCELADA = "⚠️ Execução cancelada pelo usuário".encode('utf-8')
+
+def _limpar_logs_antigos():
+    """Remove logs de execução (inclusive backups .log.N de versões anteriores) com mais de LOG_RETENTION_DAYS dias"""
+    limite = time.time() - LOG_RETENTION_DAYS * 86400
+    try:
+        with os.scandir(LOGS_DIR) as entradas:
+            for entrada in entradas:
+                nome = entrada.name
+                if not (nome.endswith(".log") or ".log." in nome):
+                    continue
+                try:
+                    if entrada.is_file() and entrada.stat().st_mtime < limite:
+                        os.remove(entrada.path)
+                except OSError as e:
+                    print(f"Erro ao remover log antigo {nome}: {e}")
+    except OSError as e:
+        print(f"Erro ao limpar logs antigos: {e}")
 
-# --- WorkerThread Integrado ---
-class WorkerThread(QThread):
-    log_signal = pyqtSignal(str)
+class _LogSink:
+    """Destino do log em disco: as linhas são gravadas por uma thread dedicada.
+
+    write() apenas enfileira os bytes, para que disco lento ou antivírus não
+    travem a automação (nem as sessões paralelas, que emitem logs sob lock).
+    A thread grava em um arquivo aberto uma vez, com buffer, e só descarrega
+    para o disco quando uma linha urgente chega (erro, mudança de status), a
+    linha pendente mais antiga passa de LOG_FLUSH_INTERVAL segundos, ou no close().
+    Acima de LOG_MAX_BYTES, apenas linhas urgentes continuam sendo gravadas.
+    """
+    def __init__(self, path):
+        self._arquivo = open(path, "ab", buffering=LOG_BUFFER_BYTES)
+        self._gravados = self._arquivo.tell()
+        self._limite_avisado = False
+        self._fila = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._gravar, name="LogSink", daemon=True)
+        self._thread.start()
+
+    def write(self, dados, urgente=False):
+        self._fila.put((dados, urgente))
+
+    def descarregar(self):
+        """Pede que o que já foi enfileirado seja gravado no disco"""
+        self._fila.put((b"", True))
+
+    def close(self):
+        if self._thread is None:
+            return
+        # None sinaliza o fim: a thread grava o restante, fecha o arquivo e encerra
+        self._fila.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _gravar(self):
+        limite = None  # prazo para o flush das linhas pendentes
+        try:
+            while True:
+                timeout = None if limite is None else max(0.0, limite - time.monotonic())
+                try:
+                    item = self._fila.get(timeout=timeout)
+                except queue.Empty:
+                    item = (b"", True)
+                if item is None:
+                    return
+                dados, urgente = item
+                if dados and not urgente and self._gravados + len(dados) > LOG_MAX_BYTES:
+                    if self._limite_avisado:
+                        continue
+                    self._limite_avisado = True
+                    dados = B_LOG_LIMITE
+                if dados:
+                    self._gravados += len(dados)
+                    self._executar(self._arquivo.write, dados)
+                    if limite is None:
+                        limite = time.monotonic() + LOG_FLUSH_INTERVAL
+                if urgente and limite is not None:
+                    self._executar(self._arquivo.flush)
+                    limite = None
+        finally:
+            self._executar(self._arquivo.close)
+
+    @staticmethod
+    def _executar(operacao, *args):
+        # Nenhuma falha de disco pode derrubar a thread (o log seria perdido em silêncio)
+        try:
+            operacao(*args)
+        except Exception as e:
+            print(f"Erro ao gravar log: {e}")
+
+class WorkerSignals(QObject):
+    """Sinais da execução; vive na thread da interface e é reaproveitado entre execuções.
+
+    As linhas de log não viajam uma a uma: emit_log() as acumula em uma lista
+    protegida por lock e só emite log_batch_signal quando a lista estava vazia.
+    Enquanto a interface não drena o lote (take_logs), novas linhas entram no
+    mesmo lote sem gerar outro evento entre threads.
+    """
+    log_batch_signal = pyqtSignal()
     progress_signal = pyqtSignal(int)
     status_signal = pyqtSignal(str, str)
     finished_signal = pyqtSignal(float)
 
-    def __init__(self, arquivo_excel=None):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._log_lock = threading.Lock()
+        self._log_pendentes = []
+
+    def emit_log(self, texto):
+        with self._log_lock:
+            self._log_pendentes.append(texto)
+            if len(self._log_pendentes) > 1:
+                return
+        self.log_batch_signal.emit()
+
+    def take_logs(self):
+        with self._log_lock:
+            linhas, self._log_pendentes = self._log_pendentes, []
+        return linhas
+
+class WorkerRunnable(QRunnable):
+    """Execução do robô submetida ao QThreadPool global, sem criar uma thread por execução"""
+    def __init__(self, signals, arquivo_excel=None, max_sessoes=1):
         super().__init__()
+        self.setAutoDelete(True)
+        self.signals = signals
         self._running = True
         self.arquivo_excel = arquivo_excel
+        self.max_sessoes = max_sessoes
         timestamp = time.strftime("%d%m%Y_%H%M%S")
-        self.log_path = os.path.join(LOGS_DIR, f"{USUARIO}_{timestamp}.log")
+        self.log_path = f"{_USER_LOG_PREFIX}{timestamp}.log"
+        self._log_sink = None
 
     def stop(self):
+        """Pede a parada: o módulo SAP encerra ao terminar o pedido atual"""
         self._running = False
-        # Ponto de extensão: sinalizar parada no módulo SAP (se/quando implementado)
-        Sap.sinalizar_parada()
+        # Sem importar Sap aqui: se ainda não foi carregado, run() verá _running
+        sap = sys.modules.get("Sap")
+        if sap is not None:
+            sap.sinalizar_parada()
 
     def run(self):
         start_time = time.time()
-        self._write_log(f"=== Execução iniciada em {time.strftime('%d/%m/%Y %H:%M:%S')} ===")
+        try:
+            os.makedirs(LOGS_DIR, exist_ok=True)
+            _limpar_logs_antigos()
+            self._log_sink = _LogSink(self.log_path)
+        except OSError as e:
+            print(f"Erro ao abrir log: {e}")
 
-        # Configurar callbacks para o módulo SAP
-        Sap.set_callbacks(
-            progress_cb=self.progress_signal.emit,
-            status_cb=self.status_signal.emit,
-            log_cb=self.log_signal.emit
-        )
+        # Nenhuma exceção pode escapar de QRunnable.run (o PyQt aborta o processo),
+        # e finished_signal precisa sair sempre para a interface ser liberada
+        try:
+            self._write_log(time.strftime('%d/%m/%Y %H:%M:%S ==='), B_EXEC_INICIADA)
 
-        # Definir o arquivo Excel a ser usado (se fornecido)
-        if self.arquivo_excel:
-            Sap.set_arquivo_excel(self.arquivo_excel)
-            self._write_log(f"Arquivo selecionado: {self.arquivo_excel}")
+            try:
+                # Módulo de automação SAP (operações de backend), carregado só na execução
+                # para não atrasar a abertura da janela com pandas/win32com
+                import Sap
 
-        try:
-            # Executar o processo SAP integrado
-            Sap.main()
-            
-            if self._running:
-                self._write_log("✓ Execução concluída com sucesso")
-                self.status_signal.emit("Concluído com sucesso", "success")
+                # Configurar callbacks para o módulo SAP
+                Sap.set_callbacks(
+                    progress_cb=self._throttled_progress(),
+                    status_cb=self._deduped_status(),
+                    log_cb=self._log_sap
+                )
+
+                # Sessões SAP usadas em paralelo ("max_sessoes" no config.json; padrão 1)
+                Sap.set_max_sessoes(self.max_sessoes)
+
+                # Definir o arquivo Excel a ser usado (se fornecido)
+                if self.arquivo_excel:
+                    Sap.set_arquivo_excel(self.arquivo_excel)
+                    self._write_log(self.arquivo_excel, B_ARQUIVO_SEL)
+
+                # Parada pedida numa execução anterior não vale para esta; um stop()
+                # antes deste ponto é visto em _running, e depois dele, pelo Sap
+                Sap.limpar_parada()
+
+                # Executar o processo SAP integrado
+                if self._running:
+                    Sap.main()
                 
-        except Exception as e:
-            error_msg = f"✗ Erro crítico: {e}"
-            self._write_log(error_msg)
-            self.log_signal.emit(error_msg)
-            self.status_signal.emit("Erro crítico", "error")
+                if self._running:
+                    self._write_log(B_EXEC_OK)
+                    self.signals.status_signal.emit("Concluído com sucesso", "success")
+                else:
+                    self._write_log(B_EXEC_CANCELADA)
+                    
+            except Exception as e:
+                error_msg = f"✗ Erro crítico: {e}"
+                self._write_log(str(e), B_ERRO_CRITICO, urgente=True)
+                self.signals.emit_log(error_msg)
+                self.signals.status_signal.emit("Erro crítico", "error")
+        finally:
+            self._close_log()
+            self.signals.finished_signal.emit(time.time() - start_time)
 
-        end_time = time.time()
-        self.finished_signal.emit(end_time - start_time)
+    def _throttled_progress(self):
+        """Cria o callback de progresso que descarta repetições e rajadas"""
+        last_emitted_val = -1
+        last_emitted_ts = 0.0
 
-    def _write_log(self, texto):
-        try:
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                f.write(f"{timestamp} {texto}\n")
-        except Exception as e:
-            print(f"Erro ao escrever log: {e}")
+        def emit(v):
+            nonlocal last_emitted_val, last_emitted_ts
+            now = time.monotonic()
+            if v == last_emitted_val:
+                return
+            # O valor final sempre passa para a barra não ficar incompleta
+            if v < 100 and now - last_emitted_ts < PROGRESS_MIN_INTERVAL:
+                return
+            last_emitted_val = v
+            last_emitted_ts = now
+            self.signals.progress_signal.emit(v)
+
+        return emit
+
+    def _deduped_status(self):
+        """Cria o callback de status que ignora o reenvio do mesmo (texto, tipo)"""
+        last_status = None
+
+        def emit(texto, tipo):
+            nonlocal last_status
+            if (texto, tipo) == last_status:
+                return
+            last_status = (texto, tipo)
+            self.signals.status_signal.emit(texto, tipo)
+            # Mudança de status: o log em disco fica em dia com a tela
+            if self._log_sink is not None:
+                self._log_sink.descarregar()
+
+        return emit
+
+    def _log_sap(self, texto):
+        """Encaminha a linha do módulo SAP para a interface e para o log em disco"""
+        self.signals.emit_log(texto)
+        # Linhas de erro vão ao disco na hora, para sobreviver a uma queda do processo
+        self._write_log(texto, urgente=texto.lstrip().startswith(("❌", "✗")))
+
+    def _write_log(self, texto, prefixo=b"", urgente=False):
+        """Enfileira uma linha para o log em disco; texto pode ser str ou bytes já codificados"""
+        if self._log_sink is None:
+            return
+        if not isinstance(texto, bytes):
+            texto = texto.encode('utf-8')
+        self._log_sink.write(b"".join((_hms_bytes(), b" ", prefixo, texto, b"\n")), urgente)
+
+    def _close_log(self):
+        if self._log_sink is None:
+            return
+        self._log_sink.close()
+        self._log_sink = None
 
 # --- Janela principal ---
 class MainWindow(QWidget):
@@ -278,107 +741,44 @@ class MainWindow(QWidget):
         self.setMinimumSize(900, 700)
         self.resize(1000, 800)
         
+        # Linhas de log aguardando o próximo flush do console
+        self._log_buffer = []
+        
         # Carregar configurações persistidas
         self.config = load_config()
-        self.arquivo_selecionado = self.config.get('ultimo_arquivo', None)
+        self._definir_arquivo(self.config.get('ultimo_arquivo', None))
         
         self._setup_window()
         self._setup_ui()
+        self._carregar_imagens()
+        
+        # Diálogo de conclusão criado e estilizado uma única vez
+        self._finish_msgbox = QMessageBox(self)
+        self._finish_msgbox.setWindowTitle("Execução Finalizada")
+        self._finish_msgbox.setStyleSheet(_MSGBOX_QSS)
         
         # Restaura o último arquivo selecionado, quando aplicável
-        if self.arquivo_selecionado and os.path.exists(self.arquivo_selecionado):
+        if self._file_info:
             self.file_path_input.setText(self.arquivo_selecionado)
             self.clear_file_btn.setVisible(True)
-            self.adicionar_log(f"📂 Arquivo carregado das configurações: {os.path.basename(self.arquivo_selecionado)}")
+            self.adicionar_log(f"📂 Arquivo carregado das configurações: {self._file_info[0]}")
         
+        # Execução em andamento (None quando ociosa); os sinais são conectados uma vez
         self.worker = None
+        self.worker_signals = WorkerSignals(self)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker_signals.log_batch_signal.connect(self._receber_logs, queued)
+        self.worker_signals.progress_signal.connect(self.atualizar_progresso, queued)
+        self.worker_signals.status_signal.connect(self.atualizar_status, queued)
+        self.worker_signals.finished_signal.connect(self.execucao_finalizada, queued)
+        # Fechamento confirmado, aguardando o término da execução
+        self._closing = False
+        # Cancelamento pedido, aguardando o término do pedido atual
+        self._cancelando = False
 
     def _setup_window(self):
-        # Ícone da aplicação
-        url_icon = "https://i.ibb.co/m5LgjRfL/Robo.png"
-        try:
-            resposta_icon = requests.get(url_icon, timeout=3)
-            if resposta_icon.status_code == 200:
-                pixmap_icon = QPixmap()
-                pixmap_icon.loadFromData(resposta_icon.content)
-                self.setWindowIcon(QIcon(pixmap_icon))
-        except:
-            pass
-        
         # Estilos globais da aplicação (tema)
-        style_sheet = f"""
-            * {{
-                font-family: 'Inter', 'SF Pro Display', 'Segoe UI', system-ui, sans-serif;
-            }}
-            
-            QWidget {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text']};
-            }}
-            
-            QTextEdit {{
-                background-color: rgba(0, 0, 0, 0.2);
-                color: {COLORS['text']};
-                font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace;
-                font-size: 13px;
-                border: none;
-                border-radius: 12px;
-                padding: 16px;
-                line-height: 1.6;
-                selection-background-color: {COLORS['accent']};
-            }}
-            
-            QLineEdit {{
-                background-color: rgba(0, 0, 0, 0.2);
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 13px;
-            }}
-            
-            QLineEdit:focus {{
-                border: 1px solid {COLORS['accent']};
-            }}
-            
-            QLineEdit:disabled {{
-                background-color: rgba(0, 0, 0, 0.1);
-                color: {COLORS['text_muted']};
-            }}
-            
-            QScrollBar:vertical {{
-                background-color: transparent;
-                width: 6px;
-                border-radius: 3px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: rgba(255, 255, 255, 0.2);
-                border-radius: 3px;
-                min-height: 20px;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: rgba(255, 255, 255, 0.3);
-            }}
-            
-            QScrollBar:horizontal {{
-                background-color: transparent;
-                height: 6px;
-                border-radius: 3px;
-            }}
-            
-            QScrollBar::handle:horizontal {{
-                background-color: rgba(255, 255, 255, 0.2);
-                border-radius: 3px;
-                min-width: 20px;
-            }}
-            
-            QScrollBar::handle:horizontal:hover {{
-                background-color: rgba(255, 255, 255, 0.3);
-            }}
-        """
-        self.setStyleSheet(style_sheet)
+        self.setStyleSheet(_GLOBAL_QSS)
 
     def _setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -388,10 +788,10 @@ class MainWindow(QWidget):
         # Cabeçalho
         header_layout = QHBoxLayout()
         
-        # Logo
-        logo_label = QLabel()
-        self._setup_logo(logo_label)
-        header_layout.addWidget(logo_label)
+        # Logo (placeholder até a imagem remota chegar)
+        self.logo_label = QLabel()
+        self._set_fallback_logo(self.logo_label)
+        header_layout.addWidget(self.logo_label)
         
         header_layout.addSpacing(16)
         
@@ -481,9 +881,16 @@ class MainWindow(QWidget):
         log_layout.addLayout(log_header)
         
         # Área do console de logs
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setMinimumHeight(250)
+        self.log_area.setMaximumBlockCount(MAX_LOG_LINES)
+        
+        # Timer de flush do console: disparado sob demanda, agrupa as linhas de 50 ms
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
         self.log_area.setPlainText("🤖 SAP Robot carregado e pronto para execução...")
         log_layout.addWidget(self.log_area)
         
@@ -533,29 +940,68 @@ class MainWindow(QWidget):
         controls_layout.addLayout(buttons_layout)
         main_layout.addLayout(controls_layout)
 
-    def _setup_logo(self, logo_label):
-        url_logo = "https://i.ibb.co/Zp4D8B90/neodent-logo.png"
-        try:
-            resp_logo = requests.get(url_logo, timeout=3)
-            if resp_logo.status_code == 200:
-                pix = QPixmap()
-                pix.loadFromData(resp_logo.content)
-                logo_label.setPixmap(pix.scaledToHeight(44, Qt.TransformationMode.SmoothTransformation))
-            else:
-                self._set_fallback_logo(logo_label)
-        except:
-            self._set_fallback_logo(logo_label)
+    def _carregar_imagens(self):
+        """Aplica ícone e logo do cache; no cache miss, baixa sem bloquear a interface"""
+        self._nam = QNetworkAccessManager(self)
+        for url, slot in ((URL_ICON, self._aplicar_icone), (URL_LOGO, self._aplicar_logo)):
+            # Pixmap já decodificado nesta sessão (QPixmapCache) ou bytes do cache em disco
+            pix = QPixmapCache.find(url)
+            if pix is None:
+                dados = _ler_cache(url)
+                if dados:
+                    pix = _decodificar_imagem(url, dados)
+            if pix is not None:
+                slot(pix)
+                continue
+            request = QNetworkRequest(QUrl(url))
+            request.setTransferTimeout(3000)
+            reply = self._nam.get(request)
+            reply.finished.connect(lambda r=reply, u=url, f=slot: self._imagem_recebida(r, u, f))
+
+    def _imagem_recebida(self, reply, url, aplicar):
+        pix = QPixmap()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if reply.error() == QNetworkReply.NetworkError.NoError and status == 200:
+            dados = bytes(reply.readAll())
+            _gravar_cache(url, dados)
+            pix = _decodificar_imagem(url, dados)
+        reply.deleteLater()
+        aplicar(pix)
+
+    def _aplicar_icone(self, pix):
+        if not pix.isNull():
+            self.setWindowIcon(QIcon(pix))
+
+    def _aplicar_logo(self, pix):
+        if not pix.isNull():
+            self.logo_label.setText("")
+            self.logo_label.setStyleSheet("")
+            self.logo_label.setPixmap(pix.scaledToHeight(44, Qt.TransformationMode.SmoothTransformation))
+        else:
+            self._set_fallback_logo(self.logo_label)
     
     def _set_fallback_logo(self, logo_label):
         logo_label.setText("●")
         logo_label.setFont(QFont("Inter", 24))
         logo_label.setStyleSheet(f"color: {COLORS['accent']};")
 
+    def _definir_arquivo(self, caminho):
+        """Atualiza o arquivo selecionado e o cache (nome, pasta, mtime) com um único stat."""
+        self.arquivo_selecionado = caminho
+        self._file_info = None
+        if caminho:
+            try:
+                st = os.stat(caminho)
+            except OSError:
+                return
+            self._file_info = (os.path.basename(caminho), os.path.dirname(caminho), st.st_mtime)
+
+    @pyqtSlot()
     def selecionar_arquivo(self):
         """Abre o diálogo do sistema para selecionar o arquivo Excel de entrada."""
         diretorio_inicial = os.path.expanduser("~")
-        if self.arquivo_selecionado and os.path.exists(self.arquivo_selecionado):
-            diretorio_inicial = os.path.dirname(self.arquivo_selecionado)
+        if self._file_info:
+            diretorio_inicial = self._file_info[1]
         
         arquivo, _ = QFileDialog.getOpenFileName(
             self,
@@ -565,7 +1011,7 @@ class MainWindow(QWidget):
         )
         
         if arquivo:
-            self.arquivo_selecionado = arquivo
+            self._definir_arquivo(arquivo)
             self.file_path_input.setText(arquivo)
             self.clear_file_btn.setVisible(True)
             self.adicionar_log(f"📂 Arquivo selecionado: {os.path.basename(arquivo)}")
@@ -573,9 +1019,10 @@ class MainWindow(QWidget):
             self.config['ultimo_arquivo'] = arquivo
             save_config(self.config)
             
+    @pyqtSlot()
     def limpar_arquivo(self):
         """Limpa a seleção atual do arquivo, voltando ao arquivo padrão."""
-        self.arquivo_selecionado = None
+        self._definir_arquivo(None)
         self.file_path_input.clear()
         self.file_path_input.setPlaceholderText("Arquivo padrão (clique em Procurar para alterar)")
         self.clear_file_btn.setVisible(False)
@@ -585,12 +1032,15 @@ class MainWindow(QWidget):
             del self.config['ultimo_arquivo']
             save_config(self.config)
 
+    @pyqtSlot()
     def iniciar_execucao(self):
-        if self.worker and self.worker.isRunning():
+        if self.worker:
             return
         
         if self.arquivo_selecionado:
-            if not os.path.exists(self.arquivo_selecionado):
+            # Revalida logo antes de iniciar para detectar arquivo removido
+            self._definir_arquivo(self.arquivo_selecionado)
+            if self._file_info is None:
                 QMessageBox.warning(
                     self,
                     "Arquivo não encontrado",
@@ -598,19 +1048,20 @@ class MainWindow(QWidget):
                 )
                 return
         
+        self._log_buffer.clear()
         self.log_area.clear()
         self.progress_bar.setValue(0)
         self.progress_value.setText("0%")
         self.status_dot.set_status('running')
         self.status_text.setText("Iniciando")
         
-        # Inicializa e executa a thread de trabalho (processo SAP)
-        self.worker = WorkerThread(arquivo_excel=self.arquivo_selecionado)
-        self.worker.log_signal.connect(self.adicionar_log)
-        self.worker.progress_signal.connect(self.atualizar_progresso)
-        self.worker.status_signal.connect(self.atualizar_status)
-        self.worker.finished_signal.connect(self.execucao_finalizada)
-        self.worker.start()
+        # Submete a execução (processo SAP) ao pool de threads do Qt
+        self.worker = WorkerRunnable(
+            self.worker_signals,
+            arquivo_excel=self.arquivo_selecionado,
+            max_sessoes=self._max_sessoes()
+        )
+        QThreadPool.globalInstance().start(self.worker)
 
         self.start_btn.setEnabled(False)
         self.start_btn.setText("Executando...")
@@ -618,45 +1069,84 @@ class MainWindow(QWidget):
         self.browse_btn.setEnabled(False)
         self.clear_file_btn.setEnabled(False)
 
+    def _max_sessoes(self):
+        """Quantidade de sessões SAP paralelas definida em config.json ("max_sessoes"); 1 se ausente ou inválida"""
+        try:
+            return max(1, int(self.config.get('max_sessoes', 1)))
+        except (TypeError, ValueError):
+            return 1
+
+    @pyqtSlot()
+    def _receber_logs(self):
+        """Drena de uma vez o lote de linhas acumulado pela execução"""
+        for texto in self.worker_signals.take_logs():
+            self.adicionar_log(texto)
+
+    @pyqtSlot(str)
     def adicionar_log(self, texto):
         if texto.startswith("[") and "]" in texto[:10]:
-            self.log_area.append(texto)
+            self._log_buffer.append(texto)
         else:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.log_area.append(f"[{timestamp}] {texto}")
+            timestamp = _hms()
+            self._log_buffer.append(f"[{timestamp}] {texto}")
         
-        scrollbar = self.log_area.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # Agrupa as linhas recebidas em uma única inserção a cada 50 ms
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
 
+    @pyqtSlot()
+    def _flush_logs(self):
+        if not self._log_buffer:
+            return
+        
+        texto = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        documento = self.log_area.document()
+        if not documento.isEmpty():
+            texto = "\n" + texto
+        cursor = QTextCursor(documento)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(texto)
+        
+        # Cursor já está no fim: uma rolagem por lote, sem consultar o maximum() da barra
+        self.log_area.setTextCursor(cursor)
+        self.log_area.ensureCursorVisible()
+
+    @pyqtSlot(int)
     def atualizar_progresso(self, valor):
         self.progress_bar.setValue(valor)
         self.progress_value.setText(f"{valor}%")
 
+    @pyqtSlot(str, str)
     def atualizar_status(self, texto, tipo):
+        # Durante o cancelamento, mantém "Cancelando" até a execução terminar
+        if self._cancelando:
+            return
         self.status_dot.set_status(tipo)
-        self.status_text.setText(texto)
+        if texto != self.status_text.text():
+            self.status_text.setText(texto)
 
+    @pyqtSlot()
     def cancelar_execucao(self):
-        if self.worker and self.worker.isRunning():
+        if self.worker and not self._cancelando:
+            # Sem bloquear a interface: a execução para após o pedido atual e a
+            # conclusão chega por execucao_finalizada
+            self._cancelando = True
             self.worker.stop()
-            self.worker.quit()
-            self.worker.wait()
             
             self.status_dot.set_status('warning')
-            self.status_text.setText("Cancelado")
-            self.adicionar_log("⚠️ Execução cancelada pelo usuário")
-            
+            self.status_text.setText("Cancelando")
+            self.adicionar_log("⏳ Cancelamento solicitado: a execução para ao terminar o pedido atual")
             self.cancel_btn.setEnabled(False)
-            self.start_btn.setEnabled(True)
-            self.start_btn.setText("Executar")
-            self.browse_btn.setEnabled(True)
-            if self.arquivo_selecionado:
-                self.clear_file_btn.setEnabled(True)
-            
-            self.progress_bar.setValue(0)
-            self.progress_value.setText("0%")
 
+    @pyqtSlot(float)
     def execucao_finalizada(self, tempo_total):
+        self.worker = None
+        if self._closing:
+            # Conclui o fechamento pendente agora que a execução terminou
+            self.close()
+            return
+        
         self.cancel_btn.setEnabled(False)
         self.start_btn.setEnabled(True)
         self.start_btn.setText("Executar")
@@ -664,11 +1154,19 @@ class MainWindow(QWidget):
         if self.arquivo_selecionado:
             self.clear_file_btn.setEnabled(True)
         
+        if self._cancelando:
+            self._cancelando = False
+            self.status_dot.set_status('warning')
+            self.status_text.setText("Cancelado")
+            self.adicionar_log("⚠️ Execução cancelada pelo usuário")
+            self.progress_bar.setValue(0)
+            self.progress_value.setText("0%")
+            return
+        
         tempo_min = tempo_total / 60
         status_atual = self.status_text.text().lower()
         
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Execução Finalizada")
+        msg = self._finish_msgbox
         
         if "sucesso" in status_atual or "concluído" in status_atual:
             msg.setIcon(QMessageBox.Icon.Information)
@@ -681,41 +1179,16 @@ class MainWindow(QWidget):
             msg.setText("📋 SAP Robot finalizado")
         
         msg.setInformativeText(f"⏱️ Tempo total: {tempo_min:.1f} minutos\n📝 Logs salvos automaticamente")
-        
-        msg_style = f"""
-            QMessageBox {{
-                background-color: {COLORS['surface']};
-                color: {COLORS['text']};
-                font-family: 'Inter', sans-serif;
-                border-radius: 12px;
-            }}
-            QMessageBox QLabel {{
-                color: {COLORS['text']};
-                font-size: 14px;
-                padding: 8px;
-            }}
-            QMessageBox QPushButton {{
-                background-color: {COLORS['primary']};
-                color: {COLORS['text']};
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 14px;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: {COLORS['primary_hover']};
-            }}
-            QMessageBox QPushButton:pressed {{
-                background-color: {COLORS['primary']};
-            }}
-        """
-        msg.setStyleSheet(msg_style)
         msg.exec()
 
     def closeEvent(self, event):
-        if self.worker and self.worker.isRunning():
+        if self._closing:
+            # Só fecha de fato quando a execução já terminou
+            if self.worker is None:
+                event.accept()
+            else:
+                event.ignore()
+        elif self.worker:
             reply = QMessageBox.question(
                 self, 
                 'Confirmar Fechamento',
@@ -725,10 +1198,15 @@ class MainWindow(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
+                # Fecha quando a execução terminar, sem bloquear o loop de eventos
+                self._closing = True
                 self.worker.stop()
-                self.worker.quit()
-                self.worker.wait(3000)
-                event.accept()
+                
+                self.status_dot.set_status('warning')
+                self.status_text.setText("Encerrando")
+                self.start_btn.setEnabled(False)
+                self.cancel_btn.setEnabled(False)
+                event.ignore()
             else:
                 event.ignore()
         else:
@@ -10,23 +10,98 @@ Principais responsabilidades:
 """
 
 import win32com.client
+import pywintypes
 import pandas as pd
 import time
 import pythoncom
 import os
-from datetime import datetime
+import re
+import sys
+import csv
+import hashlib
+import importlib.util
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
 
 # Caminhos padrão para entrada e logs
 ARQUIVO_PADRAO = r"Arquivo.xlsx"
 LOG_PASTA = r"Log"
+# Cópias já convertidas do Excel (Parquet), na pasta local do usuário: o cache
+# nunca é lido de pasta compartilhada
+CACHE_PASTA = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"),
+                           "SAP_Robo", "cache_excel")
+# Versão do cache: incrementar ao mudar a leitura/normalização da planilha
+CACHE_VERSAO = 2
+# Quantidade de planilhas mantidas no cache
+CACHE_MAX_ARQUIVOS = 20
+
+# IDs dos objetos do SAP GUI usados na ME22N
+WND0_ID = "wnd[0]"
+WND1_ID = "wnd[1]"
+OKCD_ID = "wnd[0]/tbar[0]/okcd"
+SBAR_ID = "wnd[0]/sbar"
+BTN_SALVAR_ID = "wnd[0]/tbar[0]/btn[11]"
+BTN_OUTRO_PEDIDO_ID = "wnd[0]/tbar[1]/btn[17]"
+CAMPO_PEDIDO_ID = "wnd[1]/usr/subSUB0:SAPLMEGUI:0003/ctxtMEPO_SELECT-EBELN"
+BTN_POPUP_CANCELAR_ID = "wnd[1]/tbar[0]/btn[12]"
+BTN_POPUP_CONFIRMAR_ID = "wnd[1]/tbar[0]/btn[0]"
+BTN_POPUP_OPCAO1_ID = "wnd[1]/usr/btnSPOP-VAROPTION1"
+COMBO_ITEM_ID = (
+    "wnd[0]/usr/subSUB0:SAPLMEGUI:0015/subSUB3:SAPLMEVIEWS:1100/"
+    "subSUB2:SAPLMEVIEWS:1200/subSUB1:SAPLMEGUI:1301/"
+    "subSUB1:SAPLMEGUI:6000/cmbDYN_6000-LIST"
+)
+CAMPO_DATA_ID = (
+    "wnd[0]/usr/subSUB0:SAPLMEGUI:0015/subSUB3:SAPLMEVIEWS:1100/"
+    "subSUB2:SAPLMEVIEWS:1200/subSUB1:SAPLMEGUI:1301/"
+    "subSUB2:SAPLMEGUI:1303/tabsITEM_DETAIL/tabpTABIDT5/"
+    "ssubTABSTRIPCONTROL1SUB:SAPLMEGUI:1320/"
+    "tblSAPLMEGUITC_1320/ctxtMEPO1320-EEIND[2,0]"
+)
+
+# Objetos fixos da janela principal, que podem ser reaproveitados entre chamadas
+# (os da área de trabalho "usr" e os pop-ups mudam a cada tela e não entram no cache).
+# Barra de status e botão Salvar são sempre buscados de novo: um proxy vencido
+# poderia esconder o erro de um salvamento
+IDS_CACHEAVEIS = frozenset((WND0_ID, OKCD_ID))
+_cache_objetos = {}
+
+# Mensagens informativas da barra de status que indicam que nada foi gravado
+_SBAR_SEM_ALTERACAO = re.compile(r"sem alteração|não foi feita", re.IGNORECASE)
+
+# RPC_E_CALL_REJECTED e RPC_E_SERVERCALL_RETRYLATER: o SAP está ocupado e pede nova tentativa
+_COM_CHAMADA_RECUSADA = frozenset((-2147418111, -2147417846))
+
+# Pedido numérico, com ou sem a parte decimal zerada que o Excel acrescenta (4500000001.0)
+_PEDIDO_NUMERICO = re.compile(r"\d+(\.0*)?")
+
+# Texto de data no formato ISO (aaaa-mm-dd...), que não deve ser lido com dia primeiro
+_DATA_ISO = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 # Variáveis globais para comunicação com a interface gráfica
 progress_callback = None
 status_callback = None
 log_callback = None
+# Último progresso emitido (valores repetidos não são reenviados à interface)
+_ultimo_progresso = None
+# Com callback de log, o print só é útil se houver um terminal anexado
+_espelhar_console = True
 arquivo_excel_customizado = None
+usar_cache_excel = True
+# Sessões SAP (já abertas) usadas em paralelo; 1 = processamento sequencial
+max_sessoes = 1
 
-# Reservado para futura implementação de cancelamento cooperativo
+# Serializa as emissões para a interface/console quando há várias sessões em paralelo
+_emit_lock = threading.Lock()
+
+# Último "Data Execução" formatado e o segundo a que se refere
+_ultimo_segundo = None
+_ultima_data_execucao = ""
+
+# Parada cooperativa pedida pela interface; verificada entre um pedido e outro
 _cancelamento_solicitado = False
 
 def set_callbacks(progress_cb=None, status_cb=None, log_cb=None):
@@ -37,24 +112,61 @@ def set_callbacks(progress_cb=None, status_cb=None, log_cb=None):
         status_cb (Callable[[str, str], None] | None): Callback para status (texto, tipo).
         log_cb (Callable[[str], None] | None): Callback para mensagens de log.
     """
-    global progress_callback, status_callback, log_callback
+    global progress_callback, status_callback, log_callback, _ultimo_progresso, _espelhar_console
     progress_callback = progress_cb
     status_callback = status_cb
     log_callback = log_cb
+    _ultimo_progresso = None
+    # sys.stdout é None no executável sem console (PyInstaller --noconsole)
+    _espelhar_console = log_cb is None or bool(sys.stdout and sys.stdout.isatty())
 
 def set_arquivo_excel(caminho_arquivo):
     """Define um caminho de arquivo Excel alternativo ao padrão."""
     global arquivo_excel_customizado
     arquivo_excel_customizado = caminho_arquivo
 
+def set_usar_cache_excel(ativo):
+    """Ativa/desativa o cache do Excel convertido (desativado, a planilha é sempre relida)."""
+    global usar_cache_excel
+    usar_cache_excel = ativo
+
+def sinalizar_parada():
+    """Pede que a execução em andamento pare ao terminar o pedido atual."""
+    global _cancelamento_solicitado
+    _cancelamento_solicitado = True
+
+def limpar_parada():
+    """Descarta um pedido de parada anterior; chamado antes de iniciar uma nova execução."""
+    global _cancelamento_solicitado
+    _cancelamento_solicitado = False
+
+def set_max_sessoes(quantidade):
+    """Define quantas sessões SAP já abertas podem processar pedidos em paralelo (padrão 1)."""
+    global max_sessoes
+    max_sessoes = max(1, int(quantidade))
+
 def get_arquivo_excel():
     """Retorna o caminho do arquivo Excel a ser utilizado na execução."""
     return arquivo_excel_customizado if arquivo_excel_customizado else ARQUIVO_PADRAO
 
+def data_execucao_atual():
+    """Retorna o horário atual (AAAA-MM-DD HH:MM:SS) para o log, formatando no máximo uma vez por segundo."""
+    global _ultimo_segundo, _ultima_data_execucao
+    segundo = int(time.time())
+    if segundo != _ultimo_segundo:
+        _ultima_data_execucao = datetime.fromtimestamp(segundo).strftime("%Y-%m-%d %H:%M:%S")
+        _ultimo_segundo = segundo
+    return _ultima_data_execucao
+
 def emit_progress(value):
-    """Emite atualização de progresso para a interface (0 a 100)."""
+    """Emite atualização de progresso para a interface (0 a 100), ignorando valores repetidos."""
+    global _ultimo_progresso
     if progress_callback:
-        progress_callback(value)
+        with _emit_lock:
+            if value == _ultimo_progresso:
+                return
+            _ultimo_progresso = value
+            progress_callback(value)
 
 def emit_status(message, status_type):
     """Emite atualização de status para a interface.
@@ -64,16 +176,24 @@ def emit_status(message, status_type):
         status_type (str): Tipo do status (ex.: running, success, warning, error).
     """
     if status_callback:
-        status_callback(message, status_type)
+        with _emit_lock:
+            status_callback(message, status_type)
 
 def emit_log(message):
-    """Emite mensagem de log para a interface e console padrão."""
-    if log_callback:
-        log_callback(message)
-    print(message)
+    """Emite mensagem de log para a interface e, sem interface ou com terminal, ao console."""
+    with _emit_lock:
+        if log_callback:
+            log_callback(message)
+        if _espelhar_console:
+            print(message)
+
+def conectar_sap(indice_sessao=0, inicializar_com=True):
+    """Estabelece conexão com uma sessão aberta do SAP GUI.
 
-def conectar_sap():
-    """Estabelece conexão com a sessão ativa do SAP GUI.
+    Parâmetros:
+        indice_sessao (int): Índice da sessão na conexão (0 = primeira sessão).
+        inicializar_com (bool): Chama CoInitialize; False quando a thread já
+            inicializou o COM (ex.: threads do processamento paralelo, em MTA).
 
     Retorna:
         session (obj) | None: Objeto de sessão SAP em caso de sucesso; caso contrário, None.
@@ -81,7 +201,8 @@ def conectar_sap():
     emit_log("🔄 Inicializando conexão com SAP...")
     emit_status("Inicializando SAP", "running")
 
-    pythoncom.CoInitialize()
+    if inicializar_com:
+        pythoncom.CoInitialize()
     try:
         emit_log("🔄 Obtendo SAP GUI...")
         SapGuiAuto = win32com.client.GetObject("SAPGUI")
@@ -92,8 +213,8 @@ def conectar_sap():
         emit_log("🔄 Estabelecendo conexão...")
         connection = application.Children(0)
 
-        emit_log("🔄 Inicializando sessão...")
-        session = connection.Children(0)
+        emit_log(f"🔄 Inicializando sessão {indice_sessao}...")
+        session = connection.Children(indice_sessao)
 
         emit_log("✅ Conexão SAP estabelecida com sucesso!")
         emit_status("Conectado ao SAP", "success")
@@ -104,6 +225,19 @@ def conectar_sap():
         emit_status("Erro na conexão SAP", "error")
         return None
 
+def obter_objeto(session, objeto_id):
+    """Equivalente a session.findById, reaproveitando os objetos de IDS_CACHEAVEIS.
+
+    O cache é por sessão e é descartado em limpar_tela_sap.
+    """
+    cache = _cache_objetos.setdefault(id(session), {})
+    obj = cache.get(objeto_id)
+    if obj is None:
+        obj = session.findById(objeto_id)
+        if objeto_id in IDS_CACHEAVEIS:
+            cache[objeto_id] = obj
+    return obj
+
 def esperar_objeto(session, objeto_id, tentativas=10, intervalo=0.5):
     """Aguarda um objeto da interface do SAP ficar disponível.
 
@@ -122,30 +256,75 @@ def esperar_objeto(session, objeto_id, tentativas=10, intervalo=0.5):
     for tentativa in range(tentativas):
         try:
             return session.findById(objeto_id)
-        except:
+        except pywintypes.com_error:
             if tentativa < tentativas - 1:
                 emit_log(f"🔄 Aguardando objeto {objeto_id}... (tentativa {tentativa + 1}/{tentativas})")
             time.sleep(intervalo)
     raise Exception(f"Objeto {objeto_id} não encontrado após {tentativas*intervalo}s.")
 
+def esperar_pronto(session, timeout=10.0, intervalo=0.05):
+    """Aguarda a sessão SAP terminar o processamento, consultando session.Busy.
+
+    Substitui esperas fixas: retorna assim que o SAP fica livre.
+
+    Parâmetros:
+        session: Sessão SAP ativa.
+        timeout (float): Tempo máximo de espera, em segundos.
+        intervalo (float): Intervalo, em segundos, entre consultas.
+
+    Retorna:
+        bool: True se a sessão ficou livre; False se o tempo limite foi atingido.
+
+    Lança:
+        pywintypes.com_error: Se a sessão não responder (fechada ou desconectada).
+    """
+    limite = time.perf_counter() + timeout
+    while True:
+        try:
+            if not session.Busy:
+                return True
+        except pywintypes.com_error as e:
+            # SAP ocupado pode recusar a chamada COM temporariamente; qualquer outro erro é sessão perdida
+            if e.hresult not in _COM_CHAMADA_RECUSADA:
+                raise
+        if time.perf_counter() >= limite:
+            return False
+        time.sleep(intervalo)
+
+def pressionar_se_existir(session, objeto_id):
+    """Pressiona o botão informado apenas se ele existir na tela atual.
+
+    Usa findById(id, False), que retorna None em vez de lançar com_error,
+    evitando o custo de uma exceção COM no caso comum (sem popup).
+
+    Retorna:
+        bool: True se o botão foi pressionado.
+    """
+    botao = session.findById(objeto_id, False)
+    if botao is None:
+        return False
+    botao.press()
+    esperar_pronto(session)
+    return True
+
 def limpar_tela_sap(session):
     """Limpa diálogos/resíduos e retorna à tela principal da sessão SAP."""
+    # Troca de transação: objetos guardados desta sessão deixam de valer
+    _cache_objetos.pop(id(session), None)
     try:
+        # Fecha popups pendentes; sem wnd[1] aberta, nenhum botão é consultado
         for i in range(5):
-            try:
-                session.findById("wnd[1]/tbar[0]/btn[12]").press()
-            except:
+            if session.findById(WND1_ID, False) is None:
+                break
+            if not pressionar_se_existir(session, BTN_POPUP_CANCELAR_ID):
                 break
 
-        session.findById("wnd[0]/tbar[0]/okcd").text = "/n"
-        session.findById("wnd[0]").sendVKey(0)
-        time.sleep(0.5)
+        obter_objeto(session, OKCD_ID).text = "/n"
+        obter_objeto(session, WND0_ID).sendVKey(0)
+        esperar_pronto(session)
 
-        try:
-            session.findById("wnd[1]/usr/btnSPOP-VAROPTION1").press()
-            time.sleep(0.5)
-        except:
-            pass
+        if session.findById(WND1_ID, False) is not None:
+            pressionar_se_existir(session, BTN_POPUP_OPCAO1_ID)
 
     except Exception as e:
         emit_log(f"⚠️ Erro ao limpar tela: {e}")
@@ -155,9 +334,10 @@ def verificar_erro_sap(session):
 
     Retorna:
         str | None: Mensagem de erro/aviso de interesse; None se não houver.
+        Se a barra de status não puder ser lida, isso também é tratado como erro.
     """
     try:
-        status_bar = session.findById("wnd[0]/sbar")
+        status_bar = session.findById(SBAR_ID)
         if status_bar:
             message_type = status_bar.MessageType
             message_text = status_bar.Text.strip()
@@ -166,31 +346,153 @@ def verificar_erro_sap(session):
                 return f"Erro SAP: {message_text}"
             elif message_type == 'W':
                 emit_log(f"⚠️ Aviso SAP: {message_text}")
-            elif message_type == 'I':
-                if "sem alteração" in message_text.lower() or "não foi feita" in message_text.lower():
-                    return f"Informação SAP: {message_text}"
-        return None
-    except:
+            elif message_type == 'I' and _SBAR_SEM_ALTERACAO.search(message_text):
+                return f"Informação SAP: {message_text}"
         return None
+    except pywintypes.com_error as e:
+        return f"Erro SAP: barra de status indisponível ({e})"
 
 def formatar_data(valor):
-    """Formata valores de data para o padrão dd.mm.aaaa esperado pelo SAP."""
+    """Formata valores de data para o padrão dd.mm.aaaa esperado pelo SAP.
+
+    Para uma coluna inteira (pandas.Series), delega para formatar_datas.
+    """
+    if isinstance(valor, pd.Series):
+        return formatar_datas(valor)
     if pd.isna(valor):
         return ""
-    if isinstance(valor, pd.Timestamp):
+    if isinstance(valor, date):
         return valor.strftime("%d.%m.%Y")
 
     valor_str = str(valor).strip()
     if "." in valor_str:
         return valor_str
     try:
-        data = pd.to_datetime(valor_str, dayfirst=True, errors="coerce")
+        data = pd.to_datetime(valor_str, dayfirst=not _DATA_ISO.match(valor_str), errors="coerce")
         if pd.notna(data):
             return data.strftime("%d.%m.%Y")
-    except:
+    except (ValueError, TypeError):
         pass
     return valor_str
 
+def formatar_datas(serie):
+    """Versão vetorizada de formatar_data: formata a coluna inteira em uma única passada.
+
+    Mesmas regras por célula: vazio vira "", data do Excel é formatada direto,
+    texto com "." é mantido, texto ISO (aaaa-mm-dd) é lido como tal e o restante
+    é interpretado com dia primeiro (ficando o texto original quando não for uma data).
+
+    Retorna:
+        pandas.Series: Datas no formato dd.mm.aaaa (str).
+    """
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie.dt.strftime("%d.%m.%Y").fillna("")
+
+    valido = serie.notna()
+    texto = serie.astype(str).str.strip()
+    eh_data = serie.map(lambda v: isinstance(v, date))
+    a_interpretar = valido & ~eh_data & ~texto.str.contains(".", regex=False)
+
+    datas = pd.Series(pd.NaT, index=serie.index, dtype="datetime64[ns]")
+    if eh_data.any():
+        datas[eh_data] = pd.to_datetime(serie[eh_data], errors="coerce")
+    iso = a_interpretar & texto.str.match(_DATA_ISO.pattern)
+    if iso.any():
+        datas[iso] = pd.to_datetime(texto[iso], format="ISO8601", errors="coerce")
+    a_interpretar &= ~iso
+    if a_interpretar.any():
+        datas[a_interpretar] = pd.to_datetime(
+            texto[a_interpretar], format="mixed", dayfirst=True, errors="coerce"
+        )
+
+    resultado = datas.dt.strftime("%d.%m.%Y").fillna(texto)
+    return resultado.where(valido, "")
+
+def abrir_pedido(session, pedido):
+    """Abre a transação ME22N a partir da tela inicial e carrega o pedido informado.
+
+    Lança:
+        Exception: Se a transação ou o pedido não puderem ser abertos.
+    """
+    limpar_tela_sap(session)
+
+    # Abrir transação ME22N
+    emit_log(f"📋 Abrindo transação ME22N para pedido {pedido}")
+    janela = obter_objeto(session, WND0_ID)
+    janela.maximize()
+    obter_objeto(session, OKCD_ID).text = "me22n"
+    janela.sendVKey(0)
+    esperar_pronto(session)
+
+    erro = verificar_erro_sap(session)
+    if erro:
+        raise Exception(f"Erro ao abrir ME22N: {erro}")
+
+    # Inserir número do pedido
+    emit_log(f"🔍 Buscando pedido {pedido}")
+    session.findById(BTN_OUTRO_PEDIDO_ID).press()
+    session.findById(CAMPO_PEDIDO_ID).text = str(pedido)
+    session.findById(WND1_ID).sendVKey(0)
+    esperar_pronto(session)
+
+    erro = verificar_erro_sap(session)
+    if erro:
+        raise Exception(f"Pedido não encontrado: {erro}")
+
+def editar_linha(session, linha, nova_data):
+    """Seleciona a linha (item) no pedido aberto e preenche a nova data de entrega.
+
+    Retorna:
+        bool: True se a data foi alterada; False se o item já estava com a data informada.
+
+    Lança:
+        Exception: Se o item não for encontrado ou o campo não aceitar a nova data.
+    """
+    # Navegar para a linha específica
+    emit_log(f"📝 Navegando para linha {linha}")
+    linha_int = int(float(linha))
+    key_str = f"{linha_int // 10:4d}"
+
+    combo = esperar_objeto(session, COMBO_ITEM_ID, tentativas=5)
+    combo.setFocus()
+    combo.key = key_str
+    esperar_pronto(session)
+
+    # Alterar a data
+    emit_log(f"📅 Alterando data para {nova_data}")
+    celula = esperar_objeto(session, CAMPO_DATA_ID, tentativas=5)
+    valor_atual = celula.text.strip()
+
+    if valor_atual == nova_data:
+        return False
+
+    celula.text = nova_data
+    celula.caretPosition = 2
+    esperar_pronto(session)
+
+    if celula.text.strip() != nova_data:
+        raise Exception(f"O campo de data não foi atualizado. Esperado: {nova_data}, Atual: {celula.text.strip()}")
+    return True
+
+def salvar_pedido(session, pedido):
+    """Salva o pedido aberto, confirmando os diálogos de salvamento quando aplicável.
+
+    Lança:
+        Exception: Se o SAP reportar erro após salvar.
+    """
+    emit_log(f"💾 Salvando alterações do pedido {pedido}")
+    session.findById(BTN_SALVAR_ID).press()
+    esperar_pronto(session)
+
+    # Confirmar salvamento (quando aplicável)
+    if session.findById(WND1_ID, False) is not None:
+        pressionar_se_existir(session, BTN_POPUP_CONFIRMAR_ID)
+        pressionar_se_existir(session, BTN_POPUP_OPCAO1_ID)
+
+    erro = verificar_erro_sap(session)
+    if erro:
+        raise Exception(f"Erro após salvar: {erro}")
+
 def alterar_data(session, pedido, linha, nova_data, max_tentativas=2):
     """Altera a data de entrega de um item de pedido na ME22N.
 
@@ -207,87 +509,14 @@ def alterar_data(session, pedido, linha, nova_data, max_tentativas=2):
     for tentativa in range(1, max_tentativas + 1):
         try:
             emit_log(f"🔄 Processando pedido {pedido}, linha {linha} (tentativa {tentativa}/{max_tentativas})")
-            limpar_tela_sap(session)
+            abrir_pedido(session, pedido)
 
-            # Abrir transação ME22N
-            emit_log(f"📋 Abrindo transação ME22N para pedido {pedido}")
-            session.findById("wnd[0]").maximize()
-            session.findById("wnd[0]/tbar[0]/okcd").text = "me22n"
-            session.findById("wnd[0]").sendVKey(0)
-            time.sleep(1)
-
-            erro = verificar_erro_sap(session)
-            if erro:
-                raise Exception(f"Erro ao abrir ME22N: {erro}")
-
-            # Inserir número do pedido
-            emit_log(f"🔍 Buscando pedido {pedido}")
-            session.findById("wnd[0]/tbar[1]/btn[17]").press()
-            session.findById("wnd[1]/usr/subSUB0:SAPLMEGUI:0003/ctxtMEPO_SELECT-EBELN").text = str(pedido)
-            session.findById("wnd[1]").sendVKey(0)
-            time.sleep(1.5)
-
-            erro = verificar_erro_sap(session)
-            if erro:
-                raise Exception(f"Pedido não encontrado: {erro}")
-
-            # Navegar para a linha específica
-            emit_log(f"📝 Navegando para linha {linha}")
-            combo_id = ("wnd[0]/usr/subSUB0:SAPLMEGUI:0015/subSUB3:SAPLMEVIEWS:1100/"
-                        "subSUB2:SAPLMEVIEWS:1200/subSUB1:SAPLMEGUI:1301/"
-                        "subSUB1:SAPLMEGUI:6000/cmbDYN_6000-LIST")
-            linha_int = int(float(linha))
-            key_str = f"{linha_int // 10:4d}"
-
-            combo = esperar_objeto(session, combo_id, tentativas=5)
-            combo.setFocus()
-            combo.key = key_str
-            time.sleep(1)
-
-            # Alterar a data
-            emit_log(f"📅 Alterando data para {nova_data}")
-            campo_data = (
-                "wnd[0]/usr/subSUB0:SAPLMEGUI:0015/subSUB3:SAPLMEVIEWS:1100/"
-                "subSUB2:SAPLMEVIEWS:1200/subSUB1:SAPLMEGUI:1301/"
-                "subSUB2:SAPLMEGUI:1303/tabsITEM_DETAIL/tabpTABIDT5/"
-                "ssubTABSTRIPCONTROL1SUB:SAPLMEGUI:1320/"
-                "tblSAPLMEGUITC_1320/ctxtMEPO1320-EEIND[2,0]"
-            )
-            celula = esperar_objeto(session, campo_data, tentativas=5)
-            valor_atual = celula.text.strip()
-
-            if valor_atual == nova_data:
+            if not editar_linha(session, linha, nova_data):
                 msg = f"⚠️ Pedido {pedido}, linha {linha} já estava com a data {nova_data}"
                 emit_log(msg)
                 return "PULADO", msg
 
-            celula.text = nova_data
-            celula.caretPosition = 2
-            time.sleep(0.5)
-
-            if celula.text.strip() != nova_data:
-                raise Exception(f"O campo de data não foi atualizado. Esperado: {nova_data}, Atual: {celula.text.strip()}")
-
-            # Salvar alterações
-            emit_log(f"💾 Salvando alterações do pedido {pedido}")
-            session.findById("wnd[0]/tbar[0]/btn[11]").press()
-            time.sleep(1.5)
-
-            # Confirmar salvamento (quando aplicável)
-            try:
-                session.findById("wnd[1]/tbar[0]/btn[0]").press()
-                time.sleep(0.5)
-            except:
-                pass
-            try:
-                session.findById("wnd[1]/usr/btnSPOP-VAROPTION1").press()
-                time.sleep(0.5)
-            except:
-                pass
-
-            erro = verificar_erro_sap(session)
-            if erro:
-                raise Exception(f"Erro após salvar: {erro}")
+            salvar_pedido(session, pedido)
 
             msg = f"✅ Pedido {pedido}, linha {linha} atualizado para {nova_data}"
             emit_log(msg)
@@ -309,25 +538,366 @@ def alterar_data(session, pedido, linha, nova_data, max_tentativas=2):
 
     return "ERRO", f"❌ Falha desconhecida no pedido {pedido}, linha {linha}"
 
-def salvar_logs_csv(resultados, pasta_base):
-    """Gera arquivo CSV consolidando os resultados do processamento.
+def alterar_datas_pedido(session, pedido, itens, max_tentativas=2):
+    """Altera várias linhas de um mesmo pedido abrindo e salvando a ME22N uma única vez.
+
+    Se a edição em grupo falhar antes do salvamento, cada linha é refeita
+    individualmente com alterar_data, preservando o status por item. Se a falha
+    ocorrer ao salvar, o pedido pode ter sido gravado no SAP: as linhas editadas
+    são marcadas como ERRO com a mensagem do SAP, sem serem refeitas.
+
+    Parâmetros:
+        session: Sessão SAP ativa.
+        pedido (str | int): Número do pedido.
+        itens (list[tuple[int, str]]): Pares (linha, nova_data) do pedido.
+        max_tentativas (int): Tentativas de repetição por linha no modo individual.
+
+    Retorna:
+        list[Tuple[str, str]]: (status, mensagem) de cada item, na ordem de itens.
+    """
+    if len(itens) == 1:
+        linha, nova_data = itens[0]
+        return [alterar_data(session, pedido, linha, nova_data, max_tentativas)]
+
+    try:
+        emit_log(f"🔄 Processando pedido {pedido} ({len(itens)} linhas em uma única edição)")
+        abrir_pedido(session, pedido)
+
+        retornos = []
+        alterou = False
+        for linha, nova_data in itens:
+            if editar_linha(session, linha, nova_data):
+                alterou = True
+                retornos.append(("SUCESSO", f"✅ Pedido {pedido}, linha {linha} atualizado para {nova_data}"))
+            else:
+                retornos.append(("PULADO", f"⚠️ Pedido {pedido}, linha {linha} já estava com a data {nova_data}"))
+
+    except Exception as e:
+        emit_log(f"❌ Erro na edição em grupo do pedido {pedido}: {e}")
+        emit_log("🔁 Refazendo as linhas do pedido individualmente...")
+        limpar_tela_sap(session)
+        return [alterar_data(session, pedido, linha, nova_data, max_tentativas) for linha, nova_data in itens]
+
+    if alterou:
+        try:
+            salvar_pedido(session, pedido)
+        except Exception as e:
+            # O salvamento já pode ter sido gravado: refazer as linhas mascararia o resultado real
+            emit_log(f"❌ Erro ao salvar o pedido {pedido}: {e}")
+            limpar_tela_sap(session)
+            retornos = [
+                ("ERRO", f"❌ Pedido {pedido}, linha {linha}: {e}") if status == "SUCESSO" else (status, msg)
+                for (linha, _), (status, msg) in zip(itens, retornos)
+            ]
+
+    for _, msg in retornos:
+        emit_log(msg)
+    return retornos
+
+def _motor_excel():
+    """Retorna o engine do pandas usado na leitura: calamine, se instalado; senão o padrão (None)."""
+    return "calamine" if importlib.util.find_spec("python_calamine") else None
+
+def _ler_excel(caminho):
+    """Lê a primeira aba do Excel com o engine calamine (Rust); sem python-calamine, usa o padrão do pandas."""
+    return pd.read_excel(caminho, sheet_name=0, engine=_motor_excel())
+
+def _normalizar_colunas_mistas(df):
+    """Converte colunas object (tipos misturados na mesma coluna) em texto, mantendo as células vazias.
+
+    O Parquet exige um tipo por coluna; a conversão é feita também sem cache,
+    para que a leitura direta e a do cache entreguem o mesmo DataFrame.
+    """
+    for coluna in df.columns[df.dtypes == object]:
+        df[coluna] = df[coluna].map(lambda v: v if pd.isna(v) else str(v))
+    return df
+
+def _chave_cache(caminho):
+    """Chave do cache: versão do formato e do leitor + caminho, data de modificação e tamanho do arquivo.
+
+    Usa apenas os metadados (os.stat), sem ler o conteúdo: em caso de cache
+    ausente, a planilha é lida uma única vez.
+    """
+    info = os.stat(caminho)
+    identificacao = "|".join((
+        str(CACHE_VERSAO), str(_motor_excel()), pd.__version__,
+        os.path.abspath(caminho), str(info.st_mtime_ns), str(info.st_size)
+    ))
+    return hashlib.blake2b(identificacao.encode("utf-8"), digest_size=16).hexdigest()
+
+def _podar_cache():
+    """Mantém apenas os CACHE_MAX_ARQUIVOS arquivos de cache usados mais recentemente."""
+    try:
+        with os.scandir(CACHE_PASTA) as entradas:
+            arquivos = sorted((e for e in entradas if e.is_file()),
+                              key=lambda e: e.stat().st_mtime, reverse=True)
+        for entrada in arquivos[CACHE_MAX_ARQUIVOS:]:
+            os.remove(entrada.path)
+    except OSError as e:
+        emit_log(f"⚠️ Não foi possível limpar o cache do Excel: {e}")
+
+def carregar_excel_cacheado(caminho):
+    """Carrega a primeira aba do Excel, reaproveitando a conversão de execuções anteriores.
+
+    O DataFrame lido é gravado em Parquet na pasta local do usuário
+    (CACHE_PASTA), com nome derivado de _chave_cache; enquanto a planilha não
+    mudar, as próximas execuções leem o cache em vez de interpretar o XLSX
+    novamente. Sem pyarrow, a planilha é sempre lida direto.
+
+    Retorna:
+        pandas.DataFrame: Dados da planilha.
+
+    Lança:
+        FileNotFoundError: Se o arquivo não existir.
+    """
+    if not usar_cache_excel:
+        return _normalizar_colunas_mistas(_ler_excel(caminho))
+
+    arquivo_cache = os.path.join(CACHE_PASTA, _chave_cache(caminho) + ".parquet")
+    try:
+        df = pd.read_parquet(arquivo_cache)
+        # Marca o uso, para a poda manter os caches mais recentes
+        os.utime(arquivo_cache)
+        emit_log("⚡ Planilha inalterada, dados lidos do cache")
+        return df
+    except (FileNotFoundError, ImportError):
+        pass
+    except Exception as e:
+        emit_log(f"⚠️ Cache do Excel inválido, relendo a planilha: {e}")
+
+    df = _normalizar_colunas_mistas(_ler_excel(caminho))
+    try:
+        os.makedirs(CACHE_PASTA, exist_ok=True)
+        temporario = arquivo_cache + ".tmp"
+        df.to_parquet(temporario, index=False)
+        os.replace(temporario, arquivo_cache)
+        _podar_cache()
+    except ImportError:
+        pass
+    except Exception as e:
+        emit_log(f"⚠️ Não foi possível gravar o cache do Excel: {e}")
+    return df
+
+def normalizar_pedido(valor):
+    """Retorna o número do pedido em forma canônica (texto); "" se vazio.
+
+    Remove espaços e, para pedidos numéricos, o ".0" que o Excel acrescenta e
+    os zeros à esquerda: 4500000001, 4500000001.0 e " 4500000001 " viram
+    "4500000001".
+    """
+    if pd.isna(valor):
+        return ""
+    texto = str(valor).strip()
+    if _PEDIDO_NUMERICO.fullmatch(texto):
+        texto = str(int(texto.split(".")[0]))
+    return texto
+
+def validar_registros(df):
+    """Separa as linhas da planilha que não podem ser enviadas ao SAP.
+
+    Regras: Pedido preenchido (normalizado por normalizar_pedido), Linha inteira maior que zero e NovaData
+    reconhecida como data (NovaData_fmt é uma data dd.mm.aaaa real). As linhas inválidas
+    viram resultados ERRO sem nenhuma chamada ao SAP.
+
+    Retorna:
+        Tuple[pd.DataFrame, list[dict]]: Linhas válidas (Linha convertida para int)
+        e resultados ERRO das linhas inválidas, no formato de CAMPOS_LOG.
+    """
+    # Pedido em forma canônica, para que o mesmo documento nunca vire dois grupos
+    df = df.assign(Pedido=df["Pedido"].map(normalizar_pedido))
+
+    linha_num = pd.to_numeric(df["Linha"], errors="coerce")
+    sem_pedido = df["Pedido"] == ""
+    linha_invalida = ~((linha_num > 0) & (linha_num % 1 == 0))
+    # formatar_datas mantém o texto original quando não reconhece a data
+    data_invalida = pd.to_datetime(df["NovaData_fmt"], format="%d.%m.%Y", errors="coerce").isna()
+    invalidos = sem_pedido | linha_invalida | data_invalida
+
+    data_execucao = data_execucao_atual()
+    resultados = []
+    for indice in df.index[invalidos]:
+        pedido, linha, data = df.at[indice, "Pedido"], df.at[indice, "Linha"], df.at[indice, "NovaData"]
+        if sem_pedido[indice]:
+            motivo = "Pedido não informado"
+        elif linha_invalida[indice]:
+            motivo = f"Linha inválida: {linha}"
+        elif pd.isna(data):
+            motivo = "Data não informada"
+        else:
+            motivo = f"Data inválida: {data}"
+        resultados.append({
+            "Pedido": pedido,
+            "Linha": "" if pd.isna(linha) else str(linha),
+            "Nova Data": "" if pd.isna(data) else str(data),
+            "Status": "ERRO",
+            "Mensagem": f"❌ Registro ignorado: {motivo}",
+            "Data Execução": data_execucao
+        })
+
+    validos = df[~invalidos].copy()
+    validos["Linha"] = linha_num[~invalidos].astype(int)
+    return validos, resultados
+
+def contar_sessoes(session):
+    """Retorna quantas sessões estão abertas na conexão da sessão informada."""
+    try:
+        return session.Parent.Children.Count
+    except Exception:
+        return 1
+
+def agrupar_por_pedido(df):
+    """Agrupa as linhas da planilha por pedido, na ordem da primeira ocorrência.
+
+    Retorna:
+        list[tuple]: (pedido, itens, faixa), com itens = [(linha, nova_data), ...] e
+        faixa = posição dos itens no total (ex.: "3-5"), usada nos logs.
+    """
+    dados = df[["Pedido", "Linha", "NovaData_fmt"]]
+    grupos = []
+    inicio = 1
+    for pedido, posicoes in dados.groupby("Pedido", sort=False, dropna=False).indices.items():
+        # itertuples evita montar uma Series por linha
+        itens = [(int(row.Linha), row.NovaData_fmt)
+                 for row in dados.iloc[posicoes].itertuples(index=False)]
+        fim = inicio + len(itens) - 1
+        faixa = f"{inicio}-{fim}" if fim > inicio else str(inicio)
+        grupos.append((pedido, itens, faixa))
+        inicio = fim + 1
+    return grupos
+
+def processar_pedido(session, pedido, itens, faixa, total_registros):
+    """Processa um pedido (todas as suas linhas) na sessão informada.
+
+    Retorna:
+        list[Tuple[str, str]]: (status, mensagem) de cada item, na ordem de itens.
+    """
+    linhas = ", ".join(str(linha) for linha, _ in itens)
+    emit_log(f"\n{'='*50}")
+    emit_log(f"📋 Processando {faixa}/{total_registros}: Pedido {pedido}, Linha(s) {linhas}")
+    emit_status(f"Processando pedido {pedido}", "running")
+    return alterar_datas_pedido(session, pedido, itens)
+
+def processar_em_paralelo(grupos, n_sessoes, total_registros):
+    """Distribui os pedidos entre n_sessoes sessões SAP abertas, uma thread por sessão.
+
+    Cada thread inicializa o COM no modo multithreaded (MTA), conecta à própria
+    sessão (Children(i)) e consome os pedidos de uma fila compartilhada até
+    esvaziá-la ou até sinalizar_parada() ser chamado; objetos COM não são
+    compartilhados entre threads. Se uma sessão
+    não conectar, as demais absorvem os pedidos; sem nenhuma sessão, os pedidos
+    restantes são retornados como ERRO.
+
+    Gera:
+        tuple: (pedido, itens, retornos) à medida que cada pedido é concluído.
+    """
+    pendentes = queue.SimpleQueue()
+    for grupo in grupos:
+        pendentes.put(grupo)
+    concluidos = queue.SimpleQueue()
+
+    def trabalhador(indice_sessao):
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        session = None
+        try:
+            session = conectar_sap(indice_sessao, inicializar_com=False)
+            if session is None:
+                return
+            while not _cancelamento_solicitado:
+                try:
+                    pedido, itens, faixa = pendentes.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    retornos = processar_pedido(session, pedido, itens, faixa, total_registros)
+                except Exception as e:
+                    msg = f"❌ Pedido {pedido} não processado: {e}"
+                    emit_log(msg)
+                    retornos = [("ERRO", msg)] * len(itens)
+                concluidos.put((pedido, itens, retornos))
+        finally:
+            # Os proxies COM desta thread são liberados antes de encerrar o apartment
+            if session is not None:
+                _cache_objetos.pop(id(session), None)
+            del session
+            pythoncom.CoUninitialize()
+
+    with ThreadPoolExecutor(max_workers=n_sessoes, thread_name_prefix="SessaoSAP") as executor:
+        trabalhadores = [executor.submit(trabalhador, i) for i in range(n_sessoes)]
+        restantes = len(grupos)
+        while restantes:
+            try:
+                resultado = concluidos.get(timeout=0.5)
+            except queue.Empty:
+                # Todas as threads encerraram e nada mais será produzido
+                if all(t.done() for t in trabalhadores) and concluidos.empty():
+                    break
+                continue
+            restantes -= 1
+            yield resultado
+
+    # Pedidos que nenhuma sessão chegou a processar (na parada, ficam de fora do log)
+    while not _cancelamento_solicitado and not pendentes.empty():
+        pedido, itens, _ = pendentes.get_nowait()
+        msg = f"❌ Pedido {pedido} não processado: nenhuma sessão SAP disponível"
+        emit_log(msg)
+        yield pedido, itens, [("ERRO", msg)] * len(itens)
+
+def processar_em_sequencia(session, grupos, total_registros):
+    """Processa os pedidos um a um na sessão informada, parando entre pedidos após sinalizar_parada().
+
+    Gera:
+        tuple: (pedido, itens, retornos) à medida que cada pedido é concluído.
+    """
+    for pedido, itens, faixa in grupos:
+        if _cancelamento_solicitado:
+            return
+        yield pedido, itens, processar_pedido(session, pedido, itens, faixa, total_registros)
+
+# Colunas do CSV de resultados
+CAMPOS_LOG = ["Pedido", "Linha", "Nova Data", "Status", "Mensagem", "Data Execução"]
+
+def abrir_log_csv(pasta_base):
+    """Cria o CSV de resultados, já com o cabeçalho, para receber as linhas durante a execução.
+
+    Cada resultado é gravado assim que o pedido termina, de modo que uma
+    interrupção no meio da execução preserva o que já foi processado.
 
     Parâmetros:
-        resultados (list[dict]): Lista com o resultado por item.
         pasta_base (str): Diretório onde o CSV será salvo.
 
     Retorna:
-        str: Caminho completo do arquivo CSV gerado.
+        Tuple[file, csv.DictWriter, str]: Arquivo aberto, writer e caminho completo do CSV.
     """
-    emit_log("💾 Salvando logs...")
-    log_df = pd.DataFrame(resultados)
-    if not os.path.exists(pasta_base):
-        os.makedirs(pasta_base)
+    os.makedirs(pasta_base, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     arquivo_base = os.path.join(pasta_base, f"log_alteracoes_{timestamp}.csv")
-    log_df.to_csv(arquivo_base, index=False, sep=";", encoding="utf-8-sig")
-    emit_log(f"📝 Log salvo em: {arquivo_base}")
-    return arquivo_base
+    arquivo = open(arquivo_base, "w", newline="", encoding="utf-8-sig")
+    writer = csv.DictWriter(arquivo, fieldnames=CAMPOS_LOG, delimiter=";")
+    writer.writeheader()
+    arquivo.flush()
+    return arquivo, writer, arquivo_base
+
+def salvar_logs_parquet(resultados, arquivo_csv):
+    """Grava os resultados também em Parquet (zstd), ao lado do CSV, para leitura analítica.
+
+    Opcional: sem pyarrow instalado (ou em caso de falha), apenas o CSV é mantido.
+
+    Retorna:
+        str | None: Caminho do arquivo Parquet gerado; None se não foi gerado.
+    """
+    arquivo_parquet = os.path.splitext(arquivo_csv)[0] + ".parquet"
+    try:
+        log_df = pd.DataFrame(resultados, columns=CAMPOS_LOG)
+        # Pedido/Linha podem vir misturando número e texto da planilha
+        log_df["Pedido"] = log_df["Pedido"].astype(str)
+        log_df["Linha"] = log_df["Linha"].astype(str)
+        log_df.to_parquet(arquivo_parquet, index=False, compression="zstd")
+    except ImportError:
+        return None
+    except Exception as e:
+        emit_log(f"⚠️ Não foi possível gravar o log em Parquet: {e}")
+        return None
+    return arquivo_parquet
 
 def main():
     """Ponto de entrada do processo em modo console."""
@@ -339,25 +909,37 @@ def main():
     emit_status("Carregando dados", "running")
     emit_progress(5)
 
-    # Verificar se arquivo existe
-    if not os.path.exists(arquivo_atual):
-        error_msg = f"❌ Arquivo {arquivo_atual} não encontrado."
-        emit_log(error_msg)
-        emit_status("Arquivo não encontrado", "error")
-        return
-
-    # Carregar Excel
+    # Carregar Excel (arquivo inexistente é detectado pela própria leitura)
     try:
         emit_log("📊 Carregando dados do Excel...")
-        df = pd.read_excel(arquivo_atual, sheet_name=0)
+        df = carregar_excel_cacheado(arquivo_atual)
+        df["NovaData_fmt"] = formatar_datas(df["NovaData"])
         emit_log(f"✅ {len(df)} registros carregados do Excel")
+        df, resultados_invalidos = validar_registros(df)
         emit_progress(10)
+    except FileNotFoundError:
+        error_msg = f"❌ Arquivo {arquivo_atual} não encontrado."
+        emit_log(error_msg)
+        emit_status("Arquivo não encontrado", "error")
+        return
     except Exception as e:
         error_msg = f"❌ Erro ao ler Excel: {e}"
         emit_log(error_msg)
         emit_status("Erro no Excel", "error")
         return
 
+    if resultados_invalidos:
+        emit_log(f"⚠️ {len(resultados_invalidos)} registro(s) inválido(s) não serão enviados ao SAP:")
+        for resultado in resultados_invalidos:
+            emit_log(f"   Pedido {resultado['Pedido']}, Linha {resultado['Linha']}: {resultado['Mensagem']}")
+
+    # Mesmo Pedido/Linha repetido na planilha: vale a última data informada
+    total_lido = len(df)
+    df = df.drop_duplicates(subset=["Pedido", "Linha"], keep="last")
+    if len(df) < total_lido:
+        emit_log(f"🧹 {total_lido - len(df)} registro(s) duplicado(s) (mesmo Pedido e Linha) ignorado(s); "
+                 f"mantida a última data da planilha")
+
     # Conectar SAP
     emit_progress(15)
     session = conectar_sap()
@@ -369,45 +951,73 @@ def main():
     emit_progress(25)
     emit_status("Processando pedidos", "running")
 
-    resultados = []
-    total_registros = len(df)
-
-    for idx, row in df.iterrows():
-        # Progresso proporcional (25% a 90% durante o processamento)
-        progress_atual = 25 + int((idx / total_registros) * 65)
-        emit_progress(progress_atual)
-
-        pedido = row["Pedido"]
-        linha = int(row["Linha"])
-        nova_data_raw = row["NovaData"]
-        nova_data = formatar_data(nova_data_raw)
-
-        emit_log(f"\n{'='*50}")
-        emit_log(f"📋 Processando {idx+1}/{total_registros}: Pedido {pedido}, Linha {linha}")
-        emit_status(f"Processando pedido {pedido}", "running")
-
-        status, mensagem = alterar_data(session, pedido, linha, nova_data)
+    # CSV de resultados gravado à medida que os pedidos são concluídos
+    try:
+        arquivo_log, writer, log_file = abrir_log_csv(LOG_PASTA)
+    except OSError as e:
+        emit_log(f"❌ Não foi possível criar o log em {LOG_PASTA}: {e}")
+        emit_status("Erro ao criar log", "error")
+        return
+    emit_log(f"📝 Registrando resultados em: {log_file}")
 
-        resultados.append({
-            "Pedido": pedido,
-            "Linha": linha,
-            "Nova Data": nova_data,
-            "Status": status,
-            "Mensagem": mensagem,
-            "Data Execução": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
+    # Linhas inválidas entram no log sem passar pelo SAP
+    resultados = list(resultados_invalidos)
+    writer.writerows(resultados_invalidos)
+    arquivo_log.flush()
+    total_registros = len(df)
+    processados = 0
+
+    # Linhas do mesmo pedido são editadas juntas: a ME22N abre e salva uma vez por pedido
+    grupos = agrupar_por_pedido(df)
+
+    # Pedidos distintos podem ser distribuídos entre várias sessões já abertas
+    n_sessoes = 1
+    if max_sessoes > 1:
+        disponiveis = contar_sessoes(session)
+        if disponiveis < max_sessoes:
+            emit_log(f"⚠️ {max_sessoes} sessões solicitadas, mas apenas {disponiveis} aberta(s) no SAP")
+        n_sessoes = min(max_sessoes, disponiveis, len(grupos))
+    if n_sessoes > 1:
+        emit_log(f"⚡ Processando pedidos em {n_sessoes} sessões SAP em paralelo")
+        concluidos = processar_em_paralelo(grupos, n_sessoes, total_registros)
+    else:
+        concluidos = processar_em_sequencia(session, grupos, total_registros)
+
+    with arquivo_log:
+        for pedido, itens, retornos in concluidos:
+            data_execucao = data_execucao_atual()
+
+            for (linha, nova_data), (status, mensagem) in zip(itens, retornos):
+                resultado = {
+                    "Pedido": pedido,
+                    "Linha": linha,
+                    "Nova Data": nova_data,
+                    "Status": status,
+                    "Mensagem": mensagem,
+                    "Data Execução": data_execucao
+                }
+                resultados.append(resultado)
+                writer.writerow(resultado)
+            arquivo_log.flush()
+            processados += len(itens)
+
+            # Progresso proporcional (25% a 90% durante o processamento)
+            emit_progress(25 + int((processados / total_registros) * 65))
+
+    interrompido = _cancelamento_solicitado and processados < total_registros
+    if interrompido:
+        emit_log(f"⏹️ Execução interrompida pelo usuário: {total_registros - processados} "
+                 f"registro(s) não processado(s)")
 
     # Finalizar processamento
     emit_progress(95)
-    emit_status("Salvando logs", "running")
+    log_parquet = salvar_logs_parquet(resultados, log_file)
 
-    # Salvar logs
-    log_file = salvar_logs_csv(resultados, LOG_PASTA)
-
-    # Contagem de resultados
-    sucessos = sum(1 for r in resultados if r["Status"] == "SUCESSO")
-    pulos = sum(1 for r in resultados if r["Status"] == "PULADO")
-    erros = sum(1 for r in resultados if r["Status"] == "ERRO")
+    # Contagem de resultados (uma única passada)
+    contagem = Counter(r["Status"] for r in resultados)
+    sucessos = contagem["SUCESSO"]
+    pulos = contagem["PULADO"]
+    erros = contagem["ERRO"]
 
     # Emitir resumo
     emit_progress(100)
@@ -417,6 +1027,12 @@ def main():
     emit_log(f"⚠️ Pulados: {pulos}")
     emit_log(f"❌ Erros: {erros}")
     emit_log(f"📝 Log salvo em: {log_file}")
+    if log_parquet:
+        emit_log(f"📝 Log em Parquet: {log_parquet}")
+    if interrompido:
+        emit_log("🤖 Robô interrompido")
+        emit_status("Execução interrompida", "warning")
+        return
     emit_log("🤖 Robô finalizado com sucesso!")
 
     if erros == 0: